@@ -2,57 +2,77 @@ import os
 import sys
 from student_controller import StudentController
 
+FIELD_MAHASISWA = [
+    ('nama', 'Nama', str),
+    ('email', 'Email', str),
+    ('umur', 'Umur', int),
+    ('jurusan', 'Jurusan', str),
+    ('ipk', 'IPK', float),
+]
+
+TEKS_MENU = "\n".join([
+    "\n--- Menu ---",
+    "1. Tambah Mahasiswa",
+    "2. Lihat Semua",
+    "3. Cari Mahasiswa",
+    "4. Update Mahasiswa",
+    "5. Hapus Mahasiswa",
+    "6. Keluar",
+])
+
 class AplikasiMahasiswa:
+    __slots__ = ('control', 'running')
+
     def __init__(self):
         self.control = StudentController()
         self.running = True
 
+    def bersihkan_layar(self):
+        sys.stdout.write("\x1b[H\x1b[2J")
+        sys.stdout.flush()
+
     def menu(self):
-        print("\n--- Menu ---")
-        print("1. Tambah Mahasiswa")
-        print("2. Lihat Semua")
-        print("3. Cari Mahasiswa")
-        print("4. Update Mahasiswa")
-        print("5. Hapus Mahasiswa")
-        print("6. Keluar")
+        print(TEKS_MENU)
 
     def run(self):
-        while self.run:
-            os.system('cls' if os.name == 'nt' else 'clear')
+        while self.running:
+            self.bersihkan_layar()
             self.menu()
             pilihan = input("Pilih (1-6): ")
-            if pilihan == '1':
-                self.tambah()
-            elif pilihan == '2':
-                self.lihat()
-            elif pilihan == '3':
-                self.cari()
-            elif pilihan == '4':
-                self.update()
-            elif pilihan == '5':
-                self.hapus()
-            elif pilihan == '6':
-                self.run = False
+            aksi = self._MENU.get(pilihan)
+            if aksi:
+                aksi(self)
             else:
                 print("Pilihan salah!")
                 input("Enter untuk lanjut...")
 
+    def baca_data(self, fields, akhiran=""):
+        data = {}
+        for key, label, tipe in fields:
+            while True:
+                nilai = input(f"{label}{akhiran}: ")
+                try:
+                    data[key] = tipe(nilai)
+                    break
+                except ValueError:
+                    print(f"{label} harus berupa angka.")
+        return data
+
     def tambah(self):
         print("\nTambah Mahasiswa")
-        data = {}
-        data['id'] = input("ID: ")
-        data['nama'] = input("Nama: ")
-        data['email'] = input("Email: ")
-        data['umur'] = int(input("Umur: "))
-        data['jurusan'] = input("Jurusan: ")
-        data['ipk'] = float(input("IPK: "))
+        data = {'id': input("ID: ")}
+        if self.control.cari(data['id']):
+            input("ID sudah ada. Enter...")
+            return
+        data.update(self.baca_data(FIELD_MAHASISWA))
         self.control.tambah(data)
         input("Berhasil ditambah. Enter...")
 
     def lihat(self):
         print("\nData Mahasiswa:")
-        for m in self.control.semua():
-            print(m)
+        daftar = self.control.semua()
+        if daftar:
+            print("\n".join(map(str, daftar)))
         input("Enter untuk lanjut...")
 
     def cari(self):
@@ -67,12 +87,7 @@ class AplikasiMahasiswa:
     def update(self):
         id_mhs = input("ID Mahasiswa yang mau diupdate: ")
         if self.control.cari(id_mhs):
-            data = {}
-            data['nama'] = input("Nama baru: ")
-            data['email'] = input("Email baru: ")
-            data['umur'] = int(input("Umur baru: "))
-            data['jurusan'] = input("Jurusan baru: ")
-            data['ipk'] = float(input("IPK baru: "))
+            data = self.baca_data(FIELD_MAHASISWA, " baru")
             self.control.update(id_mhs, data)
             print("Berhasil diupdate.")
         else:
@@ -87,6 +102,23 @@ class AplikasiMahasiswa:
             print("Data tidak ditemukan.")
         input("Enter untuk lanjut...")
 
+    def keluar(self):
+        self.running = False
+
+    _MENU = {
+        '1': tambah,
+        '2': lihat,
+        '3': cari,
+        '4': update,
+        '5': hapus,
+        '6': keluar,
+    }
+
 if __name__ == '__main__':
+    if os.name == 'nt':
+        # Turns on VT (ANSI escape) processing for the console; needs
+        # Windows 10 or later, older consoles print bersihkan_layar's
+        # escape sequence as raw text.
+        os.system('')
     app = AplikasiMahasiswa()
     app.run()
\ No newline at end of file
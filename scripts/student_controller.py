@@ -2,31 +2,26 @@ from student_model import Mahasiswa
 
 class StudentController:
     def __init__(self):
-        self.daftar = []
+        self.daftar = {}
 
     def tambah(self, data):
+        if data['id'] in self.daftar:
+            return False
         mhs = Mahasiswa(**data)
-        self.daftar.append(mhs)
+        self.daftar[mhs.id] = mhs
+        return True
 
     def semua(self):
-        return self.daftar
+        return list(self.daftar.values())
 
     def cari(self, id):
-        for m in self.daftar:
-            if m.id == id:
-                return m
-        return None
+        return self.daftar.get(id)
 
     def update(self, id, data_baru):
-        for i, m in enumerate(self.daftar):
-            if m.id == id:
-                self.daftar[i] = Mahasiswa(id=id, **data_baru)
-                return True
+        if id in self.daftar:
+            self.daftar[id] = Mahasiswa(id=id, **data_baru)
+            return True
         return False
 
     def hapus(self, id):
-        for i, m in enumerate(self.daftar):
-            if m.id == id:
-                del self.daftar[i]
-                return True
-        return False
+        return self.daftar.pop(id, None) is not None
\ No newline at end of file
@@ -1,4 +1,6 @@
 class Mahasiswa:
+    __slots__ = ('id', 'nama', 'email', 'umur', 'jurusan', 'ipk')
+
     def __init__(self, id, nama, email, umur, jurusan, ipk):
         self.id = id
         self.nama = nama